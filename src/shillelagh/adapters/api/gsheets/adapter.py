@@ -3,14 +3,19 @@
 Google Sheets adapter.
 """
 import datetime
+import itertools
 import json
 import logging
 import urllib.parse
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 import dateutil.tz
 from google.auth.transport.requests import AuthorizedSession
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from shillelagh.adapters.api.gsheets.lib import (
     format_error_message,
@@ -22,9 +27,14 @@ from shillelagh.adapters.api.gsheets.lib import (
     get_url,
     get_value_from_cell,
     get_values_from_row,
+    parse_query_params,
 )
 from shillelagh.adapters.api.gsheets.types import SyncMode
-from shillelagh.adapters.api.gsheets.typing import QueryResults
+from shillelagh.adapters.api.gsheets.typing import (
+    QueryResults,
+    QueryResultsColumn,
+    QueryResultsRow,
+)
 from shillelagh.adapters.base import Adapter
 from shillelagh.exceptions import (
     ImpossibleFilterError,
@@ -38,13 +48,93 @@ from shillelagh.filters import Filter
 from shillelagh.lib import SimpleCostModel, apply_limit_and_offset, build_sql
 from shillelagh.typing import RequestedOrder, Row
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
 _logger = logging.getLogger(__name__)
 
 JSON_PAYLOAD_PREFIX = ")]}'\n"
+JSON_PAYLOAD_PREFIX_BYTES = JSON_PAYLOAD_PREFIX.encode("utf-8")
+
+# Cache of sheet schemas, keyed by the Chart API URL of the sheet. Discovering
+# the schema requires an extra roundtrip to Google when the adapter is created;
+# since schemas rarely change we share them between adapter instances in the
+# same process. Each entry stores the (possibly adjusted) URL and the raw
+# columns from the Chart API response. The cache is a small LRU: once it
+# holds ``SCHEMA_CACHE_SIZE`` entries the least recently used one is evicted.
+SCHEMA_CACHE_SIZE = 128
+_schema_cache: "OrderedDict[str, Tuple[str, List[QueryResultsColumn]]]" = OrderedDict()
 
 # this is just a wild guess; used to estimate query cost
 AVERAGE_NUMBER_OF_ROWS = 1000
 
+# how many bytes to read at a time when streaming a response
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# how many rows to fetch per request when reading data
+PAGE_SIZE = 5000
+
+# Headers and query arguments shared by all requests of a given kind. These
+# are built once and passed by reference; ``requests`` copies them into the
+# prepared request, so they are never mutated.
+GVIZ_HEADERS = {"X-DataSource-Auth": "true"}
+VALUE_INPUT_PARAMS = {"valueInputOption": "USER_ENTERED"}
+# request only the values, to keep the payload small
+VALUES_PARAMS = {"valueRenderOption": "FORMATTED_VALUE", "fields": "values"}
+
+
+class ResponseStream:
+    """
+    A file-like object wrapping a streamed response body.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to ``size`` bytes from the response.
+        """
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def unread(self, data: bytes) -> None:
+        """
+        Push bytes back into the stream, so they're read again.
+        """
+        self._buffer = data + self._buffer
+
+
+@lru_cache(maxsize=256)
+def quote_sql(sql: str) -> str:
+    """
+    Percent-encode a SQL query for use in the Chart API URL.
+
+    Quoting walks the query character by character, and SQL engines tend to
+    push the same query repeatedly with only filter values changing, so the
+    result is memoized.
+    """
+    return urllib.parse.quote(sql, safe="/()")
+
 
 class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
 
@@ -88,9 +178,13 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         if uri in catalog:
             uri = catalog[uri]
 
-        parsed = urllib.parse.urlparse(uri)
-        return parsed.netloc == "docs.google.com" and parsed.path.startswith(
-            "/spreadsheets/",
+        # ``supports`` is called for every URI candidate during adapter
+        # dispatch, so a prefix check is preferred over ``urlparse``.
+        return uri.startswith(
+            (
+                "https://docs.google.com/spreadsheets/",
+                "http://docs.google.com/spreadsheets/",
+            ),
         )
 
     @staticmethod
@@ -119,6 +213,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
             subject,
             app_default_credentials,
         )
+        self.session = self._get_session()
 
         # Local data. When using DML we switch to the Google Sheets API,
         # keeping a local copy of the spreadsheets data so that we can
@@ -126,6 +221,10 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         # dataset when using a mode other than ``BIDIRECTIONAL``.
         self._sync_mode = get_sync_mode(uri) or SyncMode.BIDIRECTIONAL
         self._values: Optional[List[List[Any]]] = None
+        self._row_number_index: Optional[Dict[Tuple[Any, ...], int]] = None
+        # number of rows in the sheet when the index was built, kept in sync
+        # with it as rows are inserted and deleted
+        self._row_count = 0
         self._original_rows = 0
         self.modified = False
 
@@ -151,6 +250,10 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         # so we can ``DELETE`` or ``UPDATE`` them later.
         self._row_ids: Dict[int, Row] = {}
 
+        # Highest row ID seen so far, so that ``insert_data`` can assign a
+        # fresh ID in O(1) instead of scanning all the keys.
+        self._last_row_id = -1
+
     def _set_metadata(self, uri: str) -> None:
         """
         Get spreadsheet ID, sheet ID, sheet name, and timezone.
@@ -161,9 +264,9 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
 
         self._spreadsheet_id = parts.path.split("/")[3]
 
-        query_string = urllib.parse.parse_qs(parts.query)
+        query_string = parse_query_params(parts.query)
         if "gid" in query_string:
-            sheet_id = int(query_string["gid"][-1])
+            sheet_id = int(query_string["gid"])
         elif parts.fragment.startswith("gid="):
             sheet_id = int(parts.fragment[len("gid=") :])
         else:
@@ -173,13 +276,15 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         if not self.credentials:
             return
 
-        session = self._get_session()
+        session = self.session
         url = (
             f"https://sheets.googleapis.com/v4/spreadsheets/{self._spreadsheet_id}"
             "?includeGridData=false"
         )
+        # request only the fields we read, to keep the payload small
+        params = {"fields": "properties.timeZone,sheets.properties(sheetId,title)"}
         _logger.info("GET %s", url)
-        response = session.get(url)
+        response = session.get(url, params=params)
         payload = response.json()
         _logger.debug(payload)
         if "error" in payload:
@@ -196,10 +301,27 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
             _logger.warning("Could not determine sheet name!")
 
     def _get_session(self) -> Session:
-        return cast(
+        """
+        Build the HTTP session used to talk to the Google APIs.
+
+        Called once, when the adapter is created. All requests share the
+        resulting session, so they reuse its connection pool (and its
+        keep-alive connections) instead of paying for a new TCP+TLS
+        handshake on every API call, and get the same retry policy.
+        """
+        session = cast(
             Session,
             AuthorizedSession(self.credentials) if self.credentials else Session(),
         )
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            ),
+        )
+        return session
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -209,7 +331,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         return number of rows and columns, since they're available in the response
         payload.
         """
-        session = self._get_session()
+        session = self.session
         url = (
             f"https://sheets.googleapis.com/v4/spreadsheets/{self._spreadsheet_id}"
             "?includeGridData=false"
@@ -239,35 +361,167 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         """
         Execute a query using the Google Chart API.
         """
-        quoted_sql = urllib.parse.quote(sql, safe="/()")
+        quoted_sql = quote_sql(sql)
         url = f"{self.url}&tq={quoted_sql}"
-        headers = {"X-DataSource-Auth": "true"}
+        session = self.session
+        _logger.info("GET %s", url)
+        response = session.get(url, headers=GVIZ_HEADERS)
+        if response.status_code != 200:
+            raise ProgrammingError(response.text)
+
+        # Work on the raw bytes to avoid the full decode to ``str`` done by
+        # ``response.text``; both orjson and the stdlib accept bytes, and
+        # this way the body is decoded exactly once.
+        body = response.content
+        if body.startswith(JSON_PAYLOAD_PREFIX_BYTES):
+            body = body[len(JSON_PAYLOAD_PREFIX_BYTES) :]
+        try:
+            result = json_loads(body)
+        except ValueError as ex:
+            self._check_permissions(ex)
+            raise ProgrammingError(
+                "Response from Google is not valid JSON.",
+            ) from ex
+
+        _logger.debug("Received payload: %s", result)
+        if result["status"] == "error":
+            raise ProgrammingError(format_error_message(result["errors"]))
 
-        session = self._get_session()
+        return cast(QueryResults, result)
+
+    def _stream_query(
+        self,
+        sql: str,
+    ) -> Tuple[List[QueryResultsColumn], Iterator[QueryResultsRow]]:
+        """
+        Execute a query using the Google Chart API, streaming the results.
+
+        Like ``_run_query``, but the response is decoded incrementally with
+        ``ijson`` and rows are yielded one at a time, so peak memory is
+        bounded by a single row instead of the full result set. Used by
+        ``get_data`` when ``ijson`` is installed.
+        """
+        quoted_sql = quote_sql(sql)
+        url = f"{self.url}&tq={quoted_sql}"
+        session = self.session
         _logger.info("GET %s", url)
-        response = session.get(url, headers=headers)
-        if response.encoding is None:
-            response.encoding = "utf-8"
+        response = session.get(url, headers=GVIZ_HEADERS, stream=True)
 
         if response.status_code != 200:
             raise ProgrammingError(response.text)
 
-        if response.text.startswith(JSON_PAYLOAD_PREFIX):
-            result = json.loads(response.text[len(JSON_PAYLOAD_PREFIX) :])
-        else:
+        stream = ResponseStream(response.iter_content(STREAM_CHUNK_SIZE))
+        head = stream.read(len(JSON_PAYLOAD_PREFIX_BYTES))
+        if not head.startswith(JSON_PAYLOAD_PREFIX_BYTES):
+            stream.unread(head)
+
+        # Consume events until the columns have been read, collecting any
+        # errors on the way; the remaining events hold the rows, and are
+        # consumed lazily. In the payload ``status`` and ``errors`` come
+        # before ``table``.
+        events = ijson.parse(stream, use_float=True)
+        cols: Optional[List[QueryResultsColumn]] = None
+        try:
+            for prefix, event, value in events:
+                consumed = itertools.chain([(prefix, event, value)], events)
+                if (prefix, event) == ("errors", "start_array"):
+                    errors = next(ijson.items(consumed, "errors"))
+                    raise ProgrammingError(format_error_message(errors))
+                if (prefix, event) == ("table.cols", "start_array"):
+                    cols = next(ijson.items(consumed, "table.cols"))
+                    break
+        except ijson.JSONError as ex:
+            response.close()
+            self._check_permissions(ex)
+            raise ProgrammingError(
+                "Response from Google is not valid JSON.",
+            ) from ex
+
+        if cols is None:
+            response.close()
+            raise ProgrammingError("Response from Google has no columns.")
+
+        def gen_rows() -> Iterator[QueryResultsRow]:
             try:
-                result = response.json()
-            except Exception as ex:
-                self._check_permissions(ex)
+                yield from ijson.items(events, "table.rows.item")
+            except ijson.JSONError as ex:
                 raise ProgrammingError(
                     "Response from Google is not valid JSON.",
                 ) from ex
+            finally:
+                response.close()
 
-        _logger.debug("Received payload: %s", result)
-        if result["status"] == "error":
-            raise ProgrammingError(format_error_message(result["errors"]))
+        return cols, gen_rows()
 
-        return cast(QueryResults, result)
+    def _get_query_results(
+        self,
+        sql: str,
+    ) -> Tuple[List[QueryResultsColumn], Iterator[QueryResultsRow]]:
+        """
+        Run a query, streaming the response when ``ijson`` is available.
+        """
+        if ijson is not None:
+            return self._stream_query(sql)
+
+        payload = self._run_query(sql)
+        return payload["table"]["cols"], iter(payload["table"]["rows"])
+
+    def _get_pages(
+        self,
+        bounds: Dict[str, Filter],
+        order: List[Tuple[str, RequestedOrder]],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Tuple[List[QueryResultsColumn], Iterator[QueryResultsRow]]:
+        """
+        Fetch query results in pages of at most ``PAGE_SIZE`` rows.
+
+        Instead of downloading every matching row in a single request we
+        paginate server-side with ``LIMIT``/``OFFSET``, stopping as soon as a
+        page comes back short. This bounds the size of each response, and
+        without ``ijson`` it also bounds peak memory to one page instead of
+        the full result set.
+        """
+
+        def build_page_sql(page_limit: int, page_offset: int) -> str:
+            return build_sql(
+                self.columns,
+                bounds,
+                order,
+                None,
+                self._column_map,
+                page_limit,
+                page_offset or None,
+            )
+
+        remaining = limit
+        page_offset = offset or 0
+        page_limit = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+        cols, row_data = self._get_query_results(
+            build_page_sql(page_limit, page_offset),
+        )
+
+        def gen_pages() -> Iterator[QueryResultsRow]:
+            nonlocal remaining, page_offset, page_limit, row_data
+            while True:
+                count = 0
+                for row in row_data:
+                    count += 1
+                    yield row
+
+                if count < page_limit:
+                    return
+                page_offset += count
+                if remaining is not None:
+                    remaining -= count
+                    if remaining <= 0:
+                        return
+                    page_limit = min(PAGE_SIZE, remaining)
+                _, row_data = self._get_query_results(
+                    build_page_sql(page_limit, page_offset),
+                )
+
+        return cols, gen_pages()
 
     def _check_permissions(self, ex: Exception) -> None:
         """
@@ -276,7 +530,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         This is called when the response from an API is not valid JSON, trying to
         determine why the payload is not as expected.
         """
-        session = self._get_session()
+        session = self.session
         url = (
             f"https://sheets.googleapis.com/v4/spreadsheets/{self._spreadsheet_id}"
             f"/developerMetadata/{self._sheet_id}"
@@ -298,24 +552,36 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         Download data and extract columns.
 
         We run a simple ``SELECT * LIMIT 1`` statement to get a small response
-        so we can extract the column names and types.
-        """
-        results = self._run_query("SELECT * LIMIT 1")
-        cols = results["table"]["cols"]
-        rows = results["table"]["rows"]
-
-        # if the columns have no labels, use the first row as the labels if
-        # it exists; otherwise use just the column letters
-        if all(col["label"] == "" for col in cols):
-            _logger.warning("Couldn't extract column labels from sheet")
-            if rows:
-                # update URL with information to skip the first row
-                self.url = get_url(uri, headers=1)
-                for col, cell in zip(cols, rows[0]["c"]):
-                    col["label"] = get_value_from_cell(cell)
-            else:
-                for col in cols:
-                    col["label"] = col["id"]
+        so we can extract the column names and types. The raw columns are
+        cached at the module level, so other adapter instances pointing to the
+        same sheet can skip the query.
+        """
+        cache_key = self.url
+        cached = _schema_cache.get(cache_key)
+        if cached is not None:
+            _schema_cache.move_to_end(cache_key)
+            self.url, cols = cached
+        else:
+            results = self._run_query("SELECT * LIMIT 1")
+            cols = results["table"]["cols"]
+            rows = results["table"]["rows"]
+
+            # if the columns have no labels, use the first row as the labels if
+            # it exists; otherwise use just the column letters
+            if all(col["label"] == "" for col in cols):
+                _logger.warning("Couldn't extract column labels from sheet")
+                if rows:
+                    # update URL with information to skip the first row
+                    self.url = get_url(uri, headers=1)
+                    for col, cell in zip(cols, rows[0]["c"]):
+                        col["label"] = get_value_from_cell(cell)
+                else:
+                    for col in cols:
+                        col["label"] = col["id"]
+
+            _schema_cache[cache_key] = (self.url, cols)
+            if len(_schema_cache) > SCHEMA_CACHE_SIZE:
+                _schema_cache.popitem(last=False)
 
         self._column_map = {
             col["label"].strip(): col["id"] for col in cols if col["label"].strip()
@@ -424,32 +690,29 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         # retrieve data. This will happen before every DML query.
         else:
             try:
-                sql = build_sql(
-                    self.columns,
-                    bounds,
-                    order,
-                    None,
-                    self._column_map,
-                    limit,
-                    offset,
-                )
+                cols, row_data = self._get_pages(bounds, order, limit, offset)
             except ImpossibleFilterError:
                 return
 
-            payload = self._run_query(sql)
-            cols = payload["table"]["cols"]
+            # Hoist the column-name resolution out of the per-row loop, so
+            # each row only pays for the cell decoding; ``None`` marks
+            # columns not present in the map, which are skipped.
+            column_names = [reverse_map.get(col["id"]) for col in cols]
             rows = (
                 {
-                    reverse_map[col["id"]]: get_value_from_cell(cell)
-                    for col, cell in zip(cols, row["c"])
-                    if col["id"] in reverse_map
+                    name: get_value_from_cell(cell)
+                    for name, cell in zip(column_names, row["c"])
+                    if name is not None
                 }
-                for row in payload["table"]["rows"]
+                for row in row_data
             )
 
+        start = offset or 0
         for i, row in enumerate(rows):
-            rowid = (offset or 0) + i
+            rowid = start + i
             self._row_ids[rowid] = row
+            if rowid > self._last_row_id:
+                self._last_row_id = rowid
             row["rowid"] = rowid
             _logger.debug(row)
             yield row
@@ -460,8 +723,10 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         """
         row_id: Optional[int] = row.pop("rowid")
         if row_id is None:
-            row_id = max(self._row_ids.keys()) + 1 if self._row_ids else 0
+            row_id = self._last_row_id + 1
         self._row_ids[row_id] = row
+        if row_id > self._last_row_id:
+            self._last_row_id = row_id
 
         row_values = get_values_from_row(row, self._column_map)
 
@@ -474,7 +739,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
 
         # In these modes we push all changes immediately to the sheet.
         if self._sync_mode in {SyncMode.BIDIRECTIONAL, SyncMode.UNIDIRECTIONAL}:
-            session = self._get_session()
+            session = self.session
             body = {
                 "range": self._sheet_name,
                 "majorDimension": "ROWS",
@@ -489,13 +754,18 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
             response = session.post(
                 url,
                 json=body,
-                params={"valueInputOption": "USER_ENTERED"},
+                params=VALUE_INPUT_PARAMS,
             )
             payload = response.json()
             _logger.debug(payload)
             if "error" in payload:
                 raise ProgrammingError(payload["error"]["message"])
 
+        # the new row is appended to the end of the sheet
+        if self._row_number_index is not None:
+            self._row_number_index.setdefault(tuple(row_values), self._row_count)
+            self._row_count += 1
+
         self.modified = True
 
         return row_id
@@ -510,12 +780,12 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         }:
             return self._values
 
-        session = self._get_session()
+        session = self.session
         url = (
             f"https://sheets.googleapis.com/v4/spreadsheets/{self._spreadsheet_id}"
             f"/values/{self._sheet_name}"
         )
-        params = {"valueRenderOption": "FORMATTED_VALUE"}
+        params = VALUES_PARAMS
 
         # Log the URL. We can't use a prepared request here to extract the URL because
         # it doesn't work with ``AuthorizedSession``.
@@ -542,13 +812,39 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         Return the 0-indexed number of a given row, defined by its values.
         """
         target_row_values = get_values_from_row(row, self._column_map)
-        for i, row_values in enumerate(self._get_values()):
-            # pad with empty strings to match size
-            padding = [""] * (len(target_row_values) - len(row_values))
-            if [*row_values, *padding] == target_row_values:
-                return i
-
-        raise ProgrammingError(f"Could not find row: {row}")
+        key = tuple(target_row_values)
+        index = self._row_number_index
+        if index is None or key not in index:
+            # A miss is not necessarily an error: only the first occurrence
+            # of duplicate rows is indexed, so after that occurrence has
+            # been deleted or updated the row can only be found by
+            # rebuilding the index.
+            index = self._build_row_number_index(len(target_row_values))
+        try:
+            return index[key]
+        except KeyError as ex:
+            raise ProgrammingError(f"Could not find row: {row}") from ex
+
+    def _build_row_number_index(self, n_cols: int) -> Dict[Tuple[Any, ...], int]:
+        """
+        Build a map from row values to the 0-indexed row number.
+
+        Without the index every ``DELETE``/``UPDATE`` has to scan all the
+        values in the sheet to find the row being modified, making bulk DML
+        quadratic. The sheet values are only downloaded here, when the index
+        is built; afterwards the DML methods maintain it incrementally. Rows
+        are padded with empty strings to the width of the column map,
+        matching how target rows are encoded; for duplicate rows the first
+        occurrence wins, as in the old scan.
+        """
+        values = self._get_values()
+        index: Dict[Tuple[Any, ...], int] = {}
+        for i, row_values in enumerate(values):
+            key = (*row_values, *[""] * (n_cols - len(row_values)))
+            index.setdefault(key, i)
+        self._row_number_index = index
+        self._row_count = len(values)
+        return index
 
     def delete_data(self, row_id: int) -> None:
         """
@@ -569,7 +865,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
 
         # In these modes we push all changes immediately to the sheet.
         if self._sync_mode in {SyncMode.BIDIRECTIONAL, SyncMode.UNIDIRECTIONAL}:
-            session = self._get_session()
+            session = self.session
             body = {
                 "requests": [
                     {
@@ -602,6 +898,16 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         # only delete row_id on a successful request
         del self._row_ids[row_id]
 
+        # Rows after the deleted one shift up by one. ``_find_row_number``
+        # above guarantees the index exists.
+        index = cast(Dict[Tuple[Any, ...], int], self._row_number_index)
+        self._row_number_index = {
+            key: number - 1 if number > row_number else number
+            for key, number in index.items()
+            if number != row_number
+        }
+        self._row_count -= 1
+
         self.modified = True
 
     def update_data(  # pylint: disable=too-many-locals
@@ -629,7 +935,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
 
         # In these modes we push all changes immediately to the sheet.
         if self._sync_mode in {SyncMode.BIDIRECTIONAL, SyncMode.UNIDIRECTIONAL}:
-            session = self._get_session()
+            session = self.session
             range_ = f"{self._sheet_name}!A{row_number + 1}"
             body = {
                 "range": range_,
@@ -640,7 +946,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
                 "https://sheets.googleapis.com/v4/spreadsheets/"
                 f"{self._spreadsheet_id}/values/{range_}"
             )
-            params = {"valueInputOption": "USER_ENTERED"}
+            params = VALUE_INPUT_PARAMS
 
             # Log the URL. We can't use a prepared request here to extract the URL because
             # it doesn't work with ``AuthorizedSession``.
@@ -659,6 +965,19 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         if new_row_id != row_id:
             del self._row_ids[row_id]
         self._row_ids[new_row_id] = row
+        if new_row_id > self._last_row_id:
+            self._last_row_id = new_row_id
+
+        # The row keeps its number, but its values (and key) change; an
+        # earlier duplicate of the new values keeps precedence.
+        # ``_find_row_number`` above guarantees the index exists and maps
+        # the old values to ``row_number``.
+        index = cast(Dict[Tuple[Any, ...], int], self._row_number_index)
+        del index[tuple(get_values_from_row(current_row, self._column_map))]
+        new_key = tuple(row_values)
+        existing = index.get(new_key)
+        if existing is None or existing > row_number:
+            index[new_key] = row_number
 
         self.modified = True
 
@@ -687,7 +1006,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         values.extend([dummy_row] * (self._original_rows - len(values)))
 
         _logger.info("Pushing pending changes to the spreadsheet")
-        session = self._get_session()
+        session = self.session
         range_ = f"{self._sheet_name}"
         body = {
             "range": range_,
@@ -698,7 +1017,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
             "https://sheets.googleapis.com/v4/spreadsheets/"
             f"{self._spreadsheet_id}/values/{range_}"
         )
-        params = {"valueInputOption": "USER_ENTERED"}
+        params = VALUE_INPUT_PARAMS
 
         # Log the URL. We can't use a prepared request here to extract the URL because
         # it doesn't work with ``AuthorizedSession``.
@@ -721,7 +1040,7 @@ class GSheetsAPI(Adapter):  # pylint: disable=too-many-instance-attributes
         """
         Delete a sheet.
         """
-        session = self._get_session()
+        session = self.session
         body = {
             "requests": [
                 {
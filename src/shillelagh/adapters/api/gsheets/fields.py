@@ -15,17 +15,16 @@ from shillelagh.adapters.api.gsheets.parsing.number import (
 from shillelagh.fields import External, Field, Internal, Order, StringBoolean
 from shillelagh.filters import Filter
 
-# timestamp format used in SQL queries
-DATETIME_SQL_QUOTE = "%Y-%m-%d %H:%M:%S"
-DATE_SQL_QUOTE = "%Y-%m-%d"
-TIME_SQL_QUOTE = "%H:%M:%S"
-
 
 class GSheetsField(Field[Internal, External]):
     """
     A base class for GSheets fields.
     """
 
+    # these classes are instantiated once per column, so keep them small and
+    # their attribute access cheap
+    __slots__ = ("pattern", "timezone")
+
     # the default formats for date and datetime do not follow the same syntax
     # as user-configured formats (I suspect it uses ICU instead)
     pattern_substitutions = {
@@ -81,6 +80,8 @@ class GSheetsDateTime(GSheetsField[str, datetime.datetime]):
     converted to it, both when fetching data as well as when inserting rows.
     """
 
+    __slots__ = ()
+
     type = "TIMESTAMP"
     db_api_type = "DATETIME"
 
@@ -114,13 +115,15 @@ class GSheetsDateTime(GSheetsField[str, datetime.datetime]):
         if self.pattern is None or value == "" or value is None:
             return "null"
 
-        # On SQL queries the timestamp should be prefix by "datetime"
-        value = parse_date_time_pattern(
-            value,
-            self.pattern,
-            datetime.datetime,
-        ).strftime(DATETIME_SQL_QUOTE)
-        return f"datetime '{value}'"
+        # On SQL queries the timestamp should be prefix by "datetime". The
+        # f-string is equivalent to ``strftime("%Y-%m-%d %H:%M:%S")``, but
+        # skips the format-string interpreter.
+        timestamp = parse_date_time_pattern(value, self.pattern, datetime.datetime)
+        return (
+            f"datetime '{timestamp.year:04d}-{timestamp.month:02d}-"
+            f"{timestamp.day:02d} {timestamp.hour:02d}:{timestamp.minute:02d}:"
+            f"{timestamp.second:02d}'"
+        )
 
 
 class GSheetsDate(GSheetsField[str, datetime.date]):
@@ -135,6 +138,8 @@ class GSheetsDate(GSheetsField[str, datetime.date]):
 
     """
 
+    __slots__ = ()
+
     type = "DATE"
     db_api_type = "DATETIME"
 
@@ -157,10 +162,8 @@ class GSheetsDate(GSheetsField[str, datetime.date]):
             return "null"
 
         # On SQL queries the timestamp should be prefix by "date"
-        value = parse_date_time_pattern(value, self.pattern, datetime.date).strftime(
-            DATE_SQL_QUOTE,
-        )
-        return f"date '{value}'"
+        date = parse_date_time_pattern(value, self.pattern, datetime.date)
+        return f"date '{date.year:04d}-{date.month:02d}-{date.day:02d}'"
 
 
 class GSheetsTime(GSheetsField[str, datetime.time]):
@@ -175,6 +178,8 @@ class GSheetsTime(GSheetsField[str, datetime.time]):
 
     """
 
+    __slots__ = ()
+
     type = "TIME"
     db_api_type = "DATETIME"
 
@@ -200,10 +205,8 @@ class GSheetsTime(GSheetsField[str, datetime.time]):
             return "null"
 
         # On SQL queries the timestamp should be prefix by "timeofday"
-        value = parse_date_time_pattern(value, self.pattern, datetime.time).strftime(
-            TIME_SQL_QUOTE,
-        )
-        return f"timeofday '{value}'"
+        time = parse_date_time_pattern(value, self.pattern, datetime.time)
+        return f"timeofday '{time.hour:02d}:{time.minute:02d}:{time.second:02d}'"
 
 
 class GSheetsBoolean(GSheetsField[str, bool]):
@@ -214,6 +217,8 @@ class GSheetsBoolean(GSheetsField[str, bool]):
     of "FALSE".
     """
 
+    __slots__ = ()
+
     type = "BOOLEAN"
     db_api_type = "NUMBER"
 
@@ -244,6 +249,8 @@ class GSheetsNumber(GSheetsField[str, float]):
     The Google Chart/Sheets APIs return "numbers" only, encoded as strings.
     """
 
+    __slots__ = ()
+
     type = "REAL"
     db_api_type = "NUMBER"
 
@@ -280,6 +287,8 @@ class GSheetsString(GSheetsField[str, str]):
     A GSheets string.
     """
 
+    __slots__ = ()
+
     type = "TEXT"
     db_api_type = "STRING"
 
@@ -3,6 +3,7 @@ import datetime
 import itertools
 import string
 import urllib.parse
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 import google.auth
@@ -39,6 +40,39 @@ SCOPES = [
 ]
 
 
+def parse_query_params(query: str) -> Dict[str, str]:
+    """
+    Parse a URL query string into a map from key to its last value.
+
+    A lightweight replacement for ``urllib.parse.parse_qs`` for the common
+    case where only the last value of each parameter matters: it does a
+    single pass over the string, and builds no intermediate lists. Like
+    ``parse_qs``, parameters with blank values are skipped.
+
+        >>> parse_query_params("gid=0&sheet=My%20Sheet&gid=42")
+        {'gid': '42', 'sheet': 'My Sheet'}
+
+    """
+    params: Dict[str, str] = {}
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if value:
+            params[urllib.parse.unquote_plus(key)] = urllib.parse.unquote_plus(value)
+    return params
+
+
+# Map from Google Chart API types to fields and the filters they support.
+# The filter lists are shared between fields, and never mutated.
+TYPE_MAP: Dict[str, Tuple[Type[GSheetsField], List[Type[Filter]]]] = {
+    "string": (GSheetsString, [Range, Equal, NotEqual, Like, IsNull, IsNotNull]),
+    "number": (GSheetsNumber, [Range, Equal, NotEqual, IsNull, IsNotNull]),
+    "boolean": (GSheetsBoolean, [Equal, NotEqual, IsNull, IsNotNull]),
+    "date": (GSheetsDate, [Range, Equal, NotEqual, IsNull, IsNotNull]),
+    "datetime": (GSheetsDateTime, [Range, Equal, NotEqual, IsNull, IsNotNull]),
+    "timeofday": (GSheetsTime, [Range, Equal, NotEqual, IsNull, IsNotNull]),
+}
+
+
 def get_field(
     col: QueryResultsColumn,
     timezone: Optional[datetime.tzinfo] = None,
@@ -51,18 +85,7 @@ def get_field(
     if col["type"] == "datetime" and col.get("pattern") == "h:mm:ss am/pm":
         col["type"] = "timeofday"
 
-    type_map: Dict[str, Tuple[Type[GSheetsField], List[Type[Filter]]]] = {
-        "string": (GSheetsString, [Range, Equal, NotEqual, Like, IsNull, IsNotNull]),
-        "number": (GSheetsNumber, [Range, Equal, NotEqual, IsNull, IsNotNull]),
-        "boolean": (GSheetsBoolean, [Equal, NotEqual, IsNull, IsNotNull]),
-        "date": (GSheetsDate, [Range, Equal, NotEqual, IsNull, IsNotNull]),
-        "datetime": (GSheetsDateTime, [Range, Equal, NotEqual, IsNull, IsNotNull]),
-        "timeofday": (GSheetsTime, [Range, Equal, NotEqual, IsNull, IsNotNull]),
-    }
-    class_, filters = type_map.get(
-        col["type"],
-        (GSheetsString, [Range, Equal, NotEqual, Like, IsNull, IsNotNull]),
-    )
+    class_, filters = TYPE_MAP.get(col["type"], TYPE_MAP["string"])
     return class_(
         filters=filters,
         order=Order.ANY,
@@ -96,13 +119,13 @@ def get_url(
     # add the gviz endpoint
     path = "/".join((path.rstrip("/"), "gviz/tq"))
 
-    query_string = urllib.parse.parse_qs(parts.query)
+    query_string = parse_query_params(parts.query)
     if "headers" in query_string:
-        headers = int(query_string["headers"][-1])
+        headers = int(query_string["headers"])
     if "gid" in query_string:
-        gid = int(query_string["gid"][-1])
+        gid = int(query_string["gid"])
     if "sheet" in query_string:
-        sheet = query_string["sheet"][-1]
+        sheet = query_string["sheet"]
 
     if parts.fragment.startswith("gid="):
         gid = int(parts.fragment[len("gid=") :])
@@ -136,11 +159,11 @@ def get_sync_mode(uri: str) -> Optional[SyncMode]:
 
     """
     parts = urllib.parse.urlparse(uri)
-    query_string = urllib.parse.parse_qs(parts.query)
+    query_string = parse_query_params(parts.query)
     if "sync_mode" not in query_string:
         return None
 
-    parameter = query_string["sync_mode"][-1].upper()
+    parameter = query_string["sync_mode"].upper()
     try:
         sync_mode = SyncMode[parameter]
     except KeyError:
@@ -173,6 +196,22 @@ def gen_letters() -> Iterator[str]:
             letters[-1] = string.ascii_uppercase[index]
 
 
+@lru_cache(maxsize=None)
+def get_letters(n_cols: int) -> Tuple[str, ...]:
+    """
+    Return the labels of the first ``n_cols`` columns.
+
+    The result is memoized, since ``get_values_from_row`` is called once per
+    row when inserting or updating data, and regenerating the labels on
+    every call is wasted work.
+
+        >>> get_letters(3)
+        ('A', 'B', 'C')
+
+    """
+    return tuple(itertools.islice(gen_letters(), n_cols))
+
+
 def get_index_from_letters(letters: str) -> int:
     """
     Return the index of a given column label.
@@ -205,7 +244,7 @@ def get_values_from_row(row: Row, column_map: Dict[str, str]) -> List[Any]:
     """
     n_cols = get_index_from_letters(max(column_map.values())) + 1
     row = {column_map[k]: v for k, v in row.items() if k in column_map}
-    return [row.get(column, "") for column in itertools.islice(gen_letters(), n_cols)]
+    return [row.get(column, "") for column in get_letters(n_cols)]
 
 
 def get_credentials(
@@ -262,10 +301,14 @@ def get_value_from_cell(cell: Optional[QueryResultsCell]) -> Any:
         {"v": None}
 
     """
-    if cell is None or cell.get("v") is None:
+    # This runs once per cell when decoding rows, so look up each key only
+    # once.
+    if cell is None:
         return ""
 
-    if "f" in cell:
-        return cell["f"]
+    value = cell.get("v")
+    if value is None:
+        return ""
 
-    return "" if cell.get("v") is None else cell["v"]
+    formatted = cell.get("f")
+    return value if formatted is None else formatted
@@ -9,6 +9,7 @@ import re
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Type, TypeVar, Union
 
 from shillelagh.adapters.api.gsheets.parsing.base import LITERAL, Token, tokenize
@@ -468,6 +469,46 @@ class AMPM(AP):
         return {"meridiem": meridiem}, value[2:]
 
 
+TOKEN_CLASSES: List[Type[Token]] = [
+    H,
+    HHPlus,
+    M,
+    MM,
+    MMM,
+    MMMM,
+    MMMMM,
+    S,
+    SS,
+    HPlusDuration,
+    MPlusDuration,
+    SPlusDuration,
+    D,
+    DD,
+    DDD,
+    DDDDPlus,
+    YY,
+    YYYY,
+    AP,
+    AMPM,
+    ZERO,
+    LITERAL,
+]
+
+
+@lru_cache(maxsize=None)
+def _tokenize_pattern(pattern: str) -> List[Token]:
+    """
+    Tokenize a pattern, memoizing the result.
+
+    Tokenizing is expensive, since it runs several regexes against the
+    pattern, and ``parse_date_time_pattern``/``format_date_time_pattern``
+    are called once per cell when fetching data. There's only a handful
+    of patterns per spreadsheet, so we cache the token list. Tokens are
+    stateless after construction, and safe to share between calls.
+    """
+    return list(tokenize(pattern, TOKEN_CLASSES))
+
+
 def parse_date_time_pattern(
     value: str,
     pattern: str,
@@ -478,33 +519,8 @@ def parse_date_time_pattern(
 
     See https://developers.google.com/sheets/api/guides/formats?hl=en.
     """
-    classes = [
-        H,
-        HHPlus,
-        M,
-        MM,
-        MMM,
-        MMMM,
-        MMMMM,
-        S,
-        SS,
-        HPlusDuration,
-        MPlusDuration,
-        SPlusDuration,
-        D,
-        DD,
-        DDD,
-        DDDDPlus,
-        YY,
-        YYYY,
-        AP,
-        AMPM,
-        ZERO,
-        LITERAL,
-    ]
-
     kwargs: Dict[str, Any] = {}
-    tokens = list(tokenize(pattern, classes))
+    tokens = _tokenize_pattern(pattern)
     for token in tokens:
         consumed, value = token.parse(value, tokens)
         kwargs.update(**consumed)
@@ -536,33 +552,8 @@ def format_date_time_pattern(value: DateTime, pattern: str) -> str:
 
     See https://developers.google.com/sheets/api/guides/formats?hl=en.
     """
-    classes = [
-        H,
-        HHPlus,
-        M,
-        MM,
-        MMM,
-        MMMM,
-        MMMMM,
-        S,
-        SS,
-        HPlusDuration,
-        MPlusDuration,
-        SPlusDuration,
-        D,
-        DD,
-        DDD,
-        DDDDPlus,
-        YY,
-        YYYY,
-        AP,
-        AMPM,
-        ZERO,
-        LITERAL,
-    ]
-
     parts = []
-    tokens = list(tokenize(pattern, classes))
+    tokens = _tokenize_pattern(pattern)
     for token in tokens:
         parts.append(token.format(value, tokens))
 
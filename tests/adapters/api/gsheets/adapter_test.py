@@ -16,7 +16,8 @@ import requests
 import requests_mock
 from pytest_mock import MockerFixture
 
-from shillelagh.adapters.api.gsheets.adapter import GSheetsAPI
+from shillelagh.adapters.api.gsheets import adapter as adapter_module
+from shillelagh.adapters.api.gsheets.adapter import GSheetsAPI, ResponseStream
 from shillelagh.backends.apsw.db import connect
 from shillelagh.exceptions import (
     InterfaceError,
@@ -67,7 +68,7 @@ def simple_sheet_adapter() -> Iterator[requests_mock.Adapter]:
     )
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         json={
             "version": "0.6",
             "reqId": "0",
@@ -313,7 +314,7 @@ def test_execute_filter(
         "GET",
         (
             "https://docs.google.com/spreadsheets/d/1/gviz/"
-            "tq?gid=0&tq=SELECT%20%2A%20WHERE%20B%20%3C%205"
+            "tq?gid=0&tq=SELECT%20%2A%20WHERE%20B%20%3C%205%20LIMIT%205000"
         ),
         json={
             "version": "0.6",
@@ -436,7 +437,7 @@ def test_convert_rows(mocker: MockerFixture) -> None:
     )
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/2/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/2/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         json={
             "version": "0.6",
             "reqId": "0",
@@ -693,9 +694,13 @@ def test_get_session(mocker: MockerFixture) -> None:
     mock_session.assert_not_called()
 
 
-def test_api_bugs(mocker: MockerFixture) -> None:
+@pytest.mark.parametrize("use_ijson", [True, False])
+def test_api_bugs(mocker: MockerFixture, use_ijson: bool) -> None:
     """
     Regression test covering API bugs.
+
+    The test runs with and without ``ijson``, so that the error handling of
+    both ``_stream_query`` and ``_run_query`` is exercised.
     """
     adapter = requests_mock.Adapter()
     session = requests.Session()
@@ -704,6 +709,8 @@ def test_api_bugs(mocker: MockerFixture) -> None:
         "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
         return_value=session,
     )
+    if not use_ijson:
+        mocker.patch("shillelagh.adapters.api.gsheets.adapter.ijson", None)
     # use content= so that the response has no encoding
     adapter.register_uri(
         "GET",
@@ -734,7 +741,7 @@ def test_api_bugs(mocker: MockerFixture) -> None:
     # that it uses HTTP status codes correctly...
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/3/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/3/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         content=json.dumps(
             {
                 "version": "0.6",
@@ -776,12 +783,14 @@ def test_api_bugs(mocker: MockerFixture) -> None:
     )
 
 
+@pytest.mark.parametrize("use_ijson", [True, False])
 def test_execute_json_prefix(
     mocker: MockerFixture,
     simple_sheet_adapter: requests_mock.Adapter,
+    use_ijson: bool,
 ) -> None:
     """
-    Test removing the JSON prefix.
+    Test removing the JSON prefix, both when streaming and when not.
     """
     session = requests.Session()
     session.mount("https://", simple_sheet_adapter)
@@ -789,9 +798,11 @@ def test_execute_json_prefix(
         "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
         return_value=session,
     )
+    if not use_ijson:
+        mocker.patch("shillelagh.adapters.api.gsheets.adapter.ijson", None)
     simple_sheet_adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         text=")]}'\n"
         + json.dumps(
             {
@@ -992,7 +1003,7 @@ def test_headers_not_detected(mocker: MockerFixture) -> None:
     )
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/7/gviz/tq?headers=1&gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/7/gviz/tq?headers=1&gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         json={
             "version": "0.6",
             "reqId": "0",
@@ -1058,7 +1069,7 @@ def test_headers_not_detected_no_rows(mocker: MockerFixture) -> None:
     )
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/8/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/8/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         json={
             "version": "0.6",
             "reqId": "0",
@@ -1343,6 +1354,8 @@ def test_delete_data(
             },
         },
     )
+    # drop the index so that the next delete has to re-download the values
+    gsheets_adapter._row_number_index = None
     with pytest.raises(ProgrammingError) as excinfo:
         gsheets_adapter.delete_row(3)
     assert str(excinfo.value) == "Requested entity was not found."
@@ -1527,6 +1540,84 @@ def test_drop_table(
     assert str(excinfo.value) == "Requested entity was not found."
 
 
+def test_row_number_index_maintenance(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test that the row-number index is maintained across DML.
+
+    The sheet values should be downloaded only once; inserts, deletes, and
+    updates keep the index in sync without rebuilding it.
+    """
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.get_credentials",
+        return_value="SECRET",
+    )
+
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    simple_sheet_adapter.register_uri(
+        "POST",
+        "https://sheets.googleapis.com/v4/spreadsheets/1:batchUpdate",
+        json={"spreadsheetId": "1", "replies": [{}]},
+    )
+    simple_sheet_adapter.register_uri(
+        "POST",
+        (
+            "https://sheets.googleapis.com/v4/spreadsheets/1"
+            "/values/Sheet1:append?valueInputOption=USER_ENTERED"
+        ),
+        json={"spreadsheetId": "1"},
+    )
+    simple_sheet_adapter.register_uri(
+        "PUT",
+        (
+            "https://sheets.googleapis.com/v4/spreadsheets/1"
+            "/values/Sheet1!A5?valueInputOption=USER_ENTERED"
+        ),
+        json={"spreadsheetId": "1"},
+    )
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit", "XXX")
+    gsheets_adapter._row_ids = {
+        0: {"cnt": "10", "country": "CR"},
+        1: {"cnt": "6", "country": "ZA"},
+    }
+
+    # the delete builds the index and shifts the remaining rows
+    gsheets_adapter.delete_row(0)
+    assert gsheets_adapter._row_number_index == {
+        ("country", "cnt"): 0,
+        ("BR", "1"): 1,
+        ("BR", "3"): 2,
+        ("IN", "5"): 3,
+        ("ZA", "6"): 4,
+    }
+
+    # the insert appends to the index
+    gsheets_adapter.insert_row({"country": "PL", "cnt": "12", "rowid": 2})
+    assert gsheets_adapter._row_number_index[("PL", "12")] == 5
+
+    # the update replaces the key; the new values duplicate an existing row,
+    # and the earlier occurrence keeps precedence
+    gsheets_adapter.update_row(1, {"country": "BR", "cnt": "1", "rowid": 1})
+    assert ("ZA", "6") not in gsheets_adapter._row_number_index
+    assert gsheets_adapter._row_number_index[("BR", "1")] == 1
+
+    # a single download of the sheet values served all three statements
+    downloads = [
+        request
+        for request in simple_sheet_adapter.request_history
+        if request.method == "GET" and "/values/" in request.path
+    ]
+    assert len(downloads) == 1
+
+
 def test_batch_sync_mode(
     mocker: MockerFixture,
     simple_sheet_adapter: requests_mock.Adapter,
@@ -1638,7 +1729,7 @@ def test_batch_sync_mode(
     _logger.info.assert_called_with(
         "GET %s?%s",
         "https://sheets.googleapis.com/v4/spreadsheets/1/values/Sheet1",
-        "valueRenderOption=FORMATTED_VALUE",
+        "valueRenderOption=FORMATTED_VALUE&fields=values",
     )
 
     gsheets_adapter.delete_row(row_id)
@@ -1837,7 +1928,7 @@ def test_execute_batch(
         "GET",
         (
             "https://docs.google.com/spreadsheets/d/1"
-            "/gviz/tq?gid=0&tq=SELECT%20%2A%20WHERE%20B%20%3C%205"
+            "/gviz/tq?gid=0&tq=SELECT%20%2A%20WHERE%20B%20%3C%205%20LIMIT%205000"
         ),
         json={
             "version": "0.6",
@@ -2136,6 +2227,324 @@ def test_get_metadata(
     assert gsheets_adapter.get_metadata() == {}
 
 
+def test_get_data_without_ijson(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test that ``get_data`` falls back to ``_run_query`` when ``ijson`` is missing.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    mocker.patch("shillelagh.adapters.api.gsheets.adapter.ijson", None)
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    data = list(gsheets_adapter.get_data({}, []))
+    assert data == [
+        {"country": "BR", "cnt": "1", "rowid": 0},
+        {"country": "BR", "cnt": "3", "rowid": 1},
+        {"country": "IN", "cnt": "5", "rowid": 2},
+        {"country": "ZA", "cnt": "6", "rowid": 3},
+        {"country": "CR", "cnt": "10", "rowid": 4},
+    ]
+
+
+def test_response_stream() -> None:
+    """
+    Test ``ResponseStream``.
+    """
+    stream = ResponseStream(iter([b"ab", b"cd", b"ef"]))
+    assert stream.read(3) == b"abc"
+    stream.unread(b"abc")
+    assert stream.read() == b"abcdef"
+    assert stream.read(1) == b""
+
+
+def test_stream_query_error_response(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test error response handling when streaming results.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    simple_sheet_adapter.register_uri(
+        "GET",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
+        json={
+            "version": "0.6",
+            "reqId": "0",
+            "status": "error",
+            "errors": [
+                {
+                    "reason": "invalid_query",
+                    "message": "INVALID_QUERY",
+                    "detailed_message": "Invalid query: NO_COLUMN: C",
+                },
+            ],
+        },
+    )
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    with pytest.raises(ProgrammingError) as excinfo:
+        list(gsheets_adapter.get_data({}, []))
+    assert str(excinfo.value) == "Invalid query: NO_COLUMN: C"
+
+
+def test_stream_query_invalid_json(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test non-JSON response when streaming results.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    simple_sheet_adapter.register_uri(
+        "GET",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
+        text="NOT JSON",
+    )
+    simple_sheet_adapter.register_uri(
+        "GET",
+        "https://sheets.googleapis.com/v4/spreadsheets/1/developerMetadata/0",
+        status_code=200,
+    )
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    with pytest.raises(ProgrammingError) as excinfo:
+        list(gsheets_adapter.get_data({}, []))
+    assert str(excinfo.value) == "Response from Google is not valid JSON."
+
+
+def test_stream_query_no_columns(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test a valid JSON response with no columns when streaming results.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    simple_sheet_adapter.register_uri(
+        "GET",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
+        json={"version": "0.6", "reqId": "0", "status": "ok"},
+    )
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    with pytest.raises(ProgrammingError) as excinfo:
+        list(gsheets_adapter.get_data({}, []))
+    assert str(excinfo.value) == "Response from Google has no columns."
+
+
+def test_stream_query_truncated_rows(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test a response truncated mid-rows when streaming results.
+
+    The columns parse successfully, so the error only surfaces while the
+    rows are being consumed.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    simple_sheet_adapter.register_uri(
+        "GET",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
+        text=json.dumps(
+            {
+                "version": "0.6",
+                "reqId": "0",
+                "status": "ok",
+                "table": {
+                    "cols": [
+                        {"id": "A", "label": "country", "type": "string"},
+                        {
+                            "id": "B",
+                            "label": "cnt",
+                            "type": "number",
+                            "pattern": "General",
+                        },
+                    ],
+                    "rows": [{"c": [{"v": "BR"}, {"v": 1.0, "f": "1"}]}],
+                    "parsedNumHeaders": 0,
+                },
+            },
+        )[:-20],
+    )
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    with pytest.raises(ProgrammingError) as excinfo:
+        list(gsheets_adapter.get_data({}, []))
+    assert str(excinfo.value) == "Response from Google is not valid JSON."
+
+
+def test_get_data_pagination(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test that ``get_data`` paginates the query server-side.
+    """
+    cols = [
+        {"id": "A", "label": "country", "type": "string"},
+        {"id": "B", "label": "cnt", "type": "number", "pattern": "General"},
+    ]
+    pages = {
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq"
+        "?gid=0&tq=SELECT%20%2A%20LIMIT%202": [
+            {"c": [{"v": "BR"}, {"v": 1.0, "f": "1"}]},
+            {"c": [{"v": "BR"}, {"v": 3.0, "f": "3"}]},
+        ],
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq"
+        "?gid=0&tq=SELECT%20%2A%20LIMIT%202%20OFFSET%202": [
+            {"c": [{"v": "IN"}, {"v": 5.0, "f": "5"}]},
+            {"c": [{"v": "ZA"}, {"v": 6.0, "f": "6"}]},
+        ],
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq"
+        "?gid=0&tq=SELECT%20%2A%20LIMIT%202%20OFFSET%204": [
+            {"c": [{"v": "CR"}, {"v": 10.0, "f": "10"}]},
+        ],
+    }
+    for url, rows in pages.items():
+        simple_sheet_adapter.register_uri(
+            "GET",
+            url,
+            json={
+                "version": "0.6",
+                "reqId": "0",
+                "status": "ok",
+                "sig": "1642441872",
+                "table": {"cols": cols, "rows": rows, "parsedNumHeaders": 1},
+            },
+        )
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    mocker.patch("shillelagh.adapters.api.gsheets.adapter.PAGE_SIZE", 2)
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    data = list(gsheets_adapter.get_data({}, []))
+    assert data == [
+        {"country": "BR", "cnt": "1", "rowid": 0},
+        {"country": "BR", "cnt": "3", "rowid": 1},
+        {"country": "IN", "cnt": "5", "rowid": 2},
+        {"country": "ZA", "cnt": "6", "rowid": 3},
+        {"country": "CR", "cnt": "10", "rowid": 4},
+    ]
+
+
+def test_get_data_pagination_limit(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test that a user-supplied limit is folded into the page bounds.
+
+    With a page size of 2 and a limit of 3 the adapter should request 2
+    rows, then only the 1 remaining row, and stop.
+    """
+    cols = [
+        {"id": "A", "label": "country", "type": "string"},
+        {"id": "B", "label": "cnt", "type": "number", "pattern": "General"},
+    ]
+    pages = {
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq"
+        "?gid=0&tq=SELECT%20%2A%20LIMIT%202": [
+            {"c": [{"v": "BR"}, {"v": 1.0, "f": "1"}]},
+            {"c": [{"v": "BR"}, {"v": 3.0, "f": "3"}]},
+        ],
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq"
+        "?gid=0&tq=SELECT%20%2A%20LIMIT%201%20OFFSET%202": [
+            {"c": [{"v": "IN"}, {"v": 5.0, "f": "5"}]},
+        ],
+    }
+    for url, rows in pages.items():
+        simple_sheet_adapter.register_uri(
+            "GET",
+            url,
+            json={
+                "version": "0.6",
+                "reqId": "0",
+                "status": "ok",
+                "sig": "1642441872",
+                "table": {"cols": cols, "rows": rows, "parsedNumHeaders": 1},
+            },
+        )
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    mocker.patch("shillelagh.adapters.api.gsheets.adapter.PAGE_SIZE", 2)
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    data = list(gsheets_adapter.get_data({}, [], limit=3))
+    assert data == [
+        {"country": "BR", "cnt": "1", "rowid": 0},
+        {"country": "BR", "cnt": "3", "rowid": 1},
+        {"country": "IN", "cnt": "5", "rowid": 2},
+    ]
+    assert simple_sheet_adapter.last_request.qs["tq"] == ["select * limit 1 offset 2"]
+
+
+def test_schema_cache(
+    mocker: MockerFixture,
+    simple_sheet_adapter: requests_mock.Adapter,
+) -> None:
+    """
+    Test that the sheet schema is cached between adapter instances.
+    """
+    session = requests.Session()
+    session.mount("https://", simple_sheet_adapter)
+    mocker.patch(
+        "shillelagh.adapters.api.gsheets.adapter.GSheetsAPI._get_session",
+        return_value=session,
+    )
+    mocker.patch("shillelagh.adapters.api.gsheets.adapter.SCHEMA_CACHE_SIZE", 1)
+
+    # seed the cache so the insert below evicts this older entry
+    schema_cache = adapter_module._schema_cache
+    schema_cache["https://example.com/"] = ("https://example.com/", [])
+
+    gsheets_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    requests_before = len(simple_sheet_adapter.request_history)
+    assert "https://example.com/" not in schema_cache
+
+    # a second adapter pointing to the same sheet should not hit the network
+    cached_adapter = GSheetsAPI("https://docs.google.com/spreadsheets/d/1/edit#gid=0")
+    assert len(simple_sheet_adapter.request_history) == requests_before
+    assert cached_adapter.columns == gsheets_adapter.columns
+    assert cached_adapter._column_map == gsheets_adapter._column_map
+
+
 def test_supports() -> None:
     """
     Test ``supports``.
@@ -2204,7 +2613,7 @@ def test_empty_middle_column(mocker: MockerFixture) -> None:
     )
     adapter.register_uri(
         "GET",
-        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A",
+        "https://docs.google.com/spreadsheets/d/1/gviz/tq?gid=0&tq=SELECT%20%2A%20LIMIT%205000",
         json={
             "version": "0.6",
             "reqId": "0",
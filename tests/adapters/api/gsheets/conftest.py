@@ -0,0 +1,14 @@
+"""
+Fixtures for the GSheets adapter tests.
+"""
+import pytest
+
+from shillelagh.adapters.api.gsheets import adapter
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache() -> None:
+    """
+    Clear the module-level schema cache between tests.
+    """
+    adapter._schema_cache.clear()  # pylint: disable=protected-access
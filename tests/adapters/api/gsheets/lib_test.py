@@ -21,10 +21,12 @@ from shillelagh.adapters.api.gsheets.lib import (
     get_credentials,
     get_field,
     get_index_from_letters,
+    get_letters,
     get_sync_mode,
     get_url,
     get_value_from_cell,
     get_values_from_row,
+    parse_query_params,
 )
 from shillelagh.adapters.api.gsheets.types import SyncMode
 from shillelagh.exceptions import ProgrammingError
@@ -113,6 +115,23 @@ def test_format_error_message():
     assert format_error_message(response["errors"]) == "Invalid query: NO_COLUMN: C"
 
 
+def test_parse_query_params():
+    """
+    Test ``parse_query_params``.
+    """
+    assert parse_query_params("") == {}
+    assert parse_query_params("gid=0") == {"gid": "0"}
+    assert parse_query_params("gid=0&gid=42") == {"gid": "42"}
+    assert parse_query_params("sheet=My%20Sheet") == {"sheet": "My Sheet"}
+    assert parse_query_params("headers=1&gid=0&sheet=a") == {
+        "headers": "1",
+        "gid": "0",
+        "sheet": "a",
+    }
+    # blank values are skipped, like in ``urllib.parse.parse_qs``
+    assert parse_query_params("gid=&sheet=a") == {"sheet": "a"}
+
+
 def test_get_url():
     """
     Test ``get_url``.
@@ -250,6 +269,14 @@ def test_gen_letters():
     ]
 
 
+def test_get_letters():
+    """
+    Test ``get_letters``.
+    """
+    assert get_letters(3) == ("A", "B", "C")
+    assert get_letters(28) == tuple(itertools.islice(gen_letters(), 28))
+
+
 def test_get_index_from_letters():
     """
     Test ``get_index_from_letters``.